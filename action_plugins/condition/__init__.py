@@ -51,6 +51,15 @@ QML_IMPORT_NAME = "Gremlin.ActionPlugins"
 QML_IMPORT_MAJOR_VERSION = 1
 
 
+# Comparator class and comparator type name to use for each input type
+_comparator_lookup = {
+    InputType.JoystickAxis: (comparator.RangeComparator, "range"),
+    InputType.JoystickButton: (comparator.PressedComparator, "pressed"),
+    InputType.JoystickHat: (comparator.DirectionComparator, "direction"),
+    InputType.Keyboard: (comparator.PressedComparator, "pressed"),
+}
+
+
 class AbstractCondition(QtCore.QObject):
 
     """Base class of all individual condition representations."""
@@ -143,22 +152,10 @@ class AbstractCondition(QtCore.QObject):
         Args:
             input_type: type of input the comparator is meant for
         """
-        comparator_map = {
-            InputType.JoystickAxis: comparator.RangeComparator,
-            InputType.JoystickButton: comparator.PressedComparator,
-            InputType.JoystickHat: comparator.DirectionComparator,
-            InputType.Keyboard: comparator.PressedComparator,
-        }
-        comparator_types = {
-            InputType.JoystickAxis: "range",
-            InputType.JoystickButton: "pressed",
-            InputType.JoystickHat: "direction",
-            InputType.Keyboard: "pressed",
-        }
-        if not isinstance(self._comparator, comparator_map[input_type]):
-            self._comparator = comparator.create_default_comparator(
-                comparator_types[input_type]
-            )
+        comparator_class, comparator_type = _comparator_lookup[input_type]
+        if not isinstance(self._comparator, comparator_class):
+            self._comparator = \
+                comparator.create_default_comparator(comparator_type)
             self.comparatorChanged.emit()
 
     @Property(comparator.AbstractComparator, notify=comparatorChanged)
@@ -215,11 +212,15 @@ class KeyboardCondition(AbstractCondition):
         Args:
             node: the XML node to parse for data
         """
-        for item_node in node.findall("input"):
-            key_id = (
-                util.read_property(item_node, "scan-code", PropertyType.Int),
-                util.read_property(item_node, "is-extended", PropertyType.Bool)
+        for item_node in node.iterfind("input"):
+            values = util.read_property_dict(
+                item_node,
+                {
+                    "scan-code": PropertyType.Int,
+                    "is-extended": PropertyType.Bool
+                }
             )
+            key_id = (values["scan-code"], values["is-extended"])
             event = event_handler.Event(
                 InputType.Keyboard,
                 key_id,
@@ -313,11 +314,19 @@ class JoystickCondition(AbstractCondition):
         Args:
             node: the XML node to parse for data
         """
-        for entry in node.findall("input"):
+        for entry in node.iterfind("input"):
+            values = util.read_property_dict(
+                entry,
+                {
+                    "input-type": PropertyType.InputType,
+                    "input-id": PropertyType.Int,
+                    "device-guid": PropertyType.UUID
+                }
+            )
             event = event_handler.Event(
-                util.read_property(entry, "input-type", PropertyType.InputType),
-                util.read_property(entry, "input-id", PropertyType.Int),
-                util.read_property(entry, "device-guid", PropertyType.UUID)
+                values["input-type"],
+                values["input-id"],
+                values["device-guid"]
             )
             self._inputs.append(event)
 
@@ -417,6 +426,14 @@ class CurrentInputCondition(AbstractCondition):
             self.conditionTypeChanged.emit()
 
 
+# Mapping from condition type to the class implementing the condition
+_condition_type_lookup = {
+    ConditionType.Joystick: JoystickCondition,
+    ConditionType.Keyboard: KeyboardCondition,
+    ConditionType.CurrentInput: CurrentInputCondition,
+}
+
+
 class ConditionFunctor(AbstractFunctor):
 
     def __init__(self, action: ConditionModel):
@@ -437,7 +454,8 @@ class ConditionFunctor(AbstractFunctor):
         Returns:
             True if the condition evaluates to True, False otherwise
         """
-        outcomes = [cond(value) for cond in self.data.conditions]
+        # Lazily evaluate conditions so all / any can terminate early
+        outcomes = (cond(value) for cond in self.data.conditions)
         if self.data.logical_operator == LogicalOperator.All:
             return all(outcomes)
         elif self.data.logical_operator == LogicalOperator.Any:
@@ -476,15 +494,9 @@ class ConditionModel(ActionModel):
         Args:
             condition: Numerical value of the condition enum
         """
-        condition_lookup = {
-            ConditionType.Joystick: JoystickCondition,
-            ConditionType.Keyboard: KeyboardCondition,
-            ConditionType.CurrentInput: CurrentInputCondition,
-        }
-
         condition_type = ConditionType(condition)
-        if condition_type in condition_lookup:
-            cond = condition_lookup[condition_type](self)
+        if condition_type in _condition_type_lookup:
+            cond = _condition_type_lookup[condition_type](self)
             # If the condition is a CurrentInput one set the input type
             if condition_type == ConditionType.CurrentInput:
                 cond.set_input_type(self._data.behavior_type)
@@ -609,30 +621,23 @@ class ConditionData(AbstractActionData):
         )
 
         self.conditions = []
-        for entry in node.iter("condition"):
+        for entry in node.iterfind("condition"):
             condition_type = ConditionType.to_enum(
                 util.read_property(entry, "condition-type", PropertyType.String)
             )
-            cond_obj = None
-            if condition_type == ConditionType.Joystick:
-                cond_obj = JoystickCondition()
-            elif condition_type == ConditionType.Keyboard:
-                cond_obj = KeyboardCondition()
-            elif condition_type == ConditionType.CurrentInput:
-                cond_obj = CurrentInputCondition()
-            if cond_obj is not None:
+            if condition_type in _condition_type_lookup:
+                cond_obj = _condition_type_lookup[condition_type]()
                 cond_obj.from_xml(entry)
                 self.conditions.append(cond_obj)
 
     def _to_xml(self) -> ElementTree:
-        node = util.create_action_node(ConditionData.tag, self._id)
+        node = util.create_action_node(ConditionData.tag, self.id)
         node.append(util.create_property_node(
             "logical-operator",
             LogicalOperator.to_string(self.logical_operator),
             PropertyType.String
         ))
-        for condition in self.conditions:
-            node.append(condition.to_xml())
+        node.extend(condition.to_xml() for condition in self.conditions)
         node.append(util.create_action_ids(
             "true-actions", [action.id for action in self.true_actions]
         ))
@@ -155,8 +155,12 @@ class RangeComparator(AbstractComparator):
         return self.lower <= axis.value <= self.upper
 
     def from_xml(self, node: ElementTree.Element) -> None:
-        self.lower = util.read_property(node, "lower-limit", PropertyType.Float)
-        self.upper = util.read_property(node, "upper-limit", PropertyType.Float)
+        limits = util.read_property_dict(
+            node,
+            {"lower-limit": PropertyType.Float, "upper-limit": PropertyType.Float}
+        )
+        self.lower = limits["lower-limit"]
+        self.upper = limits["upper-limit"]
 
     def to_xml(self) -> ElementTree.Element:
         entries = [
@@ -409,10 +413,11 @@ def create_comparator_from_xml(node: ElementTree.Element) -> AbstractComparator:
             util.read_property(node, "is-pressed", PropertyType.Bool)
         )
     elif comparator_type == "range":
-        return RangeComparator(
-            util.read_property(node, "lower-limit", PropertyType.Float),
-            util.read_property(node, "upper-limit", PropertyType.Float)
+        limits = util.read_property_dict(
+            node,
+            {"lower-limit": PropertyType.Float, "upper-limit": PropertyType.Float}
         )
+        return RangeComparator(limits["lower-limit"], limits["upper-limit"])
     elif comparator_type == "direction":
         return DirectionComparator(
             util.read_properties(node, "direction", PropertyType.HatDirection)
@@ -132,7 +132,7 @@ class DescriptionData(AbstractActionData):
         )
 
     def _to_xml(self) -> ElementTree.Element:
-        node = util.create_action_node(DescriptionData.tag, self._id)
+        node = util.create_action_node(DescriptionData.tag, self.id)
         node.append(util.create_property_node(
             "description", self.description, PropertyType.String
         ))
@@ -233,7 +233,7 @@ class MapToIOData(AbstractActionData):
             )
 
     def _to_xml(self) -> ElementTree.Element:
-        node = util.create_action_node(MapToIOData.tag, self._id)
+        node = util.create_action_node(MapToIOData.tag, self.id)
         node.append(util.create_property_node(
             "io-input-guid", self.io_input_guid, PropertyType.UUID
         ))
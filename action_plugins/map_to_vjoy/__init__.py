@@ -332,7 +332,7 @@ class MapToVjoyData(AbstractActionData):
             )
 
     def _to_xml(self) -> ElementTree.Element:
-        node = util.create_action_node(MapToVjoyData.tag, self._id)
+        node = util.create_action_node(MapToVjoyData.tag, self.id)
         node.append(util.create_property_node(
             "vjoy-device-id", self.vjoy_device_id, PropertyType.Int
         ))
@@ -374,7 +374,7 @@ class MergeAxisData(AbstractActionData):
         self.children = [library.get_action(aid) for aid in child_ids]
 
     def _to_xml(self) -> ElementTree.Element:
-        node = util.create_action_node(MergeAxisData.tag, self._id)
+        node = util.create_action_node(MergeAxisData.tag, self.id)
         entries = [
             ["label", self.label, PropertyType.String],
             ["axis1-guid", self.axis_in1.device_guid, PropertyType.UUID],
@@ -262,7 +262,7 @@ class TempoData(AbstractActionData):
 
         :return XML node representing the data of this container
         """
-        node = util.create_action_node(TempoData.tag, self._id)
+        node = util.create_action_node(TempoData.tag, self.id)
         node.append(util.create_action_ids(
             "short-actions", [action.id for action in self.short_actions]
         ))
@@ -50,6 +50,8 @@ class Value:
 
     """Represents an input value, keeping track of raw and "seen" value."""
 
+    __slots__ = ("_raw", "_current")
+
     def __init__(self, raw: Any) -> None:
         """Creates a new value and initializes it.
 
@@ -97,7 +99,9 @@ class AbstractActionData(ABC):
         Args:
             behavior_type: type of behavior of this action
         """
-        self._id = uuid.uuid4()
+        # Identifier is generated on first access as actions loaded from a
+        # profile replace it with the stored one right away
+        self._id = None
         self._behavior_type = behavior_type
         self._action_label = ""
 
@@ -134,6 +138,8 @@ class AbstractActionData(ABC):
         Returns:
             Unique identifier of this action
         """
+        if self._id is None:
+            self._id = uuid.uuid4()
         return self._id
 
     @property
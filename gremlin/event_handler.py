@@ -59,6 +59,15 @@ class Event:
     whether or not the key's scan code is extended one.
     """
 
+    __slots__ = (
+        "event_type",
+        "identifier",
+        "device_guid",
+        "is_pressed",
+        "value",
+        "raw_value"
+    )
+
     def __init__(
             self,
             event_type: InputType,
@@ -489,42 +489,46 @@ class LogicalOperator(enum.Enum):
 
     @staticmethod
     def to_display(instance: LogicalOperator) -> str:
-        lookup = {
-            LogicalOperator.Any: "Any",
-            LogicalOperator.All: "All"
-        }
-        value = lookup.get(instance, None)
-        if value is None:
+        try:
+            return _LogicalOperator_to_display_lookup[instance]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid logical operator type: {str(instance)}"
             )
-        return value
 
     @staticmethod
     def to_string(instance: LogicalOperator) -> str:
-        lookup = {
-            LogicalOperator.Any: "any",
-            LogicalOperator.All: "all"
-        }
-        value = lookup.get(instance, None)
-        if value is None:
+        try:
+            return _LogicalOperator_to_string_lookup[instance]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid logical operator type: {str(instance)}"
             )
-        return value
 
     @staticmethod
     def to_enum(string: str) -> LogicalOperator:
-        lookup = {
-            "any": LogicalOperator.Any,
-            "all": LogicalOperator.All
-        }
-        value = lookup.get(string, None)
-        if value is None:
+        try:
+            return _LogicalOperator_to_enum_lookup[string]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid logical operator type: {str(string)}"
             )
-        return value
+
+
+_LogicalOperator_to_display_lookup = {
+    LogicalOperator.Any: "Any",
+    LogicalOperator.All: "All",
+}
+
+_LogicalOperator_to_string_lookup = {
+    LogicalOperator.Any: "any",
+    LogicalOperator.All: "all",
+}
+
+_LogicalOperator_to_enum_lookup = {
+    "any": LogicalOperator.Any,
+    "all": LogicalOperator.All,
+}
 
 
 class ConditionType(enum.Enum):
@@ -537,42 +541,46 @@ class ConditionType(enum.Enum):
 
     @staticmethod
     def to_display(instance: ConditionType) -> str:
-        lookup = {
-            ConditionType.Joystick: "Joystick",
-            ConditionType.Keyboard: "Keyboard",
-            ConditionType.CurrentInput: "Current Input",
-        }
-        value = lookup.get(instance, None)
-        if value is None:
+        try:
+            return _ConditionType_to_display_lookup[instance]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid condition operator type: {str(instance)}"
             )
-        return value
 
     @staticmethod
     def to_string(instance: ConditionType) -> str:
-        lookup = {
-            ConditionType.Joystick: "joystick",
-            ConditionType.Keyboard: "keyboard",
-            ConditionType.CurrentInput: "current_input",
-        }
-        value = lookup.get(instance, None)
-        if value is None:
+        try:
+            return _ConditionType_to_string_lookup[instance]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid condition operator type: {str(instance)}"
             )
-        return value
 
     @staticmethod
     def to_enum(string: str) -> ConditionType:
-        lookup = {
-            "joystick": ConditionType.Joystick,
-            "keyboard": ConditionType.Keyboard,
-            "current_input": ConditionType.CurrentInput,
-        }
-        value = lookup.get(string, None)
-        if value is None:
+        try:
+            return _ConditionType_to_enum_lookup[string]
+        except KeyError:
             raise gremlin.error.GremlinError(
                 f"Invalid condition operator type: {str(string)}"
             )
-        return value
+
+
+_ConditionType_to_display_lookup = {
+    ConditionType.Joystick: "Joystick",
+    ConditionType.Keyboard: "Keyboard",
+    ConditionType.CurrentInput: "Current Input",
+}
+
+_ConditionType_to_string_lookup = {
+    ConditionType.Joystick: "joystick",
+    ConditionType.Keyboard: "keyboard",
+    ConditionType.CurrentInput: "current_input",
+}
+
+_ConditionType_to_enum_lookup = {
+    "joystick": ConditionType.Joystick,
+    "keyboard": ConditionType.Keyboard,
+    "current_input": ConditionType.CurrentInput,
+}
@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import ctypes
+import functools
 import importlib
 import logging
 import math
@@ -123,6 +124,14 @@ def parse_id_or_uuid(value: str) -> int | uuid.UUID:
 
 
 
+# Textual representations of boolean values handled without further parsing
+_bool_lookup = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+}
+
 def parse_bool(value: str, default_value: bool = False) -> bool:
     """Returns the boolean representation of the provided value.
 
@@ -139,14 +148,15 @@ def parse_bool(value: str, default_value: bool = False) -> bool:
         return default_value
 
     # Attempt to parse the value
-    if value.isnumeric():
+    bool_value = _bool_lookup.get(value.lower(), None)
+    if bool_value is not None:
+        return bool_value
+    elif value.isnumeric():
         int_value = int(value)
         if int(value) in [0, 1]:
             return int_value == 1
         else:
             raise error.ProfileError(f"Invalid bool value used: {value}")
-    elif value.lower() in ["true", "false"]:
-        return True if value.lower() == "true" else False
     else:
         raise error.ProfileError(
             f"Invalid bool type/value used: {type(value)}/{value}"
@@ -222,6 +232,22 @@ def safe_format(
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_uuid(value: str) -> uuid.UUID:
+    """Returns the UUID represented by the provided string.
+
+    Device identifiers repeat many times within a profile and UUID instances
+    are immutable, thus parsed values are cached and shared.
+
+    Args:
+        value: string representation of the UUID
+
+    Returns:
+        UUID instance corresponding to the string
+    """
+    return uuid.UUID(value)
+
+
 # Mapping between property types and the function converting the string
 # representation into the correct data type
 _property_from_string = {
@@ -233,7 +259,7 @@ _property_from_string = {
     PropertyType.AxisMode: lambda x: AxisMode.to_enum(x),
     PropertyType.HatDirection: lambda x: HatDirection.to_enum(x),
     PropertyType.List: lambda x: x.split("|"),
-    PropertyType.UUID: lambda x: uuid.UUID(x),
+    PropertyType.UUID: _parse_uuid,
 }
 
 def property_from_string(data_type: PropertyType, value: str) -> Any:
@@ -301,7 +327,7 @@ _type_lookup = {
 }
 
 _element_parsers = {
-    "device-id": lambda x: uuid.UUID(x.text),
+    "device-id": lambda x: _parse_uuid(x.text),
     "input-type": lambda x: InputType.to_enum(x.text),
     "input-id": lambda x: parse_id_or_uuid(x.text),
     "mode": lambda x: str(x.text),
@@ -410,14 +436,13 @@ def create_property_node(
             f"for '{property_type}'."
         )
 
-    p_node = ElementTree.Element("property")
-    p_node.set("type", PropertyType.to_string(value_type))
-    n_node = ElementTree.Element("name")
-    n_node.text = name
-    v_node = ElementTree.Element("value")
-    v_node.text = property_to_string(value_type, value)
-    p_node.append(n_node)
-    p_node.append(v_node)
+    p_node = ElementTree.Element(
+        "property",
+        {"type": PropertyType.to_string(value_type)}
+    )
+    ElementTree.SubElement(p_node, "name").text = name
+    ElementTree.SubElement(p_node, "value").text = \
+        property_to_string(value_type, value)
     return p_node
 
 
@@ -447,10 +472,10 @@ def create_action_node(
     Returns:
         XML element containing the provided data
     """
-    node = ElementTree.Element("action")
-    node.set("id", safe_format(action_id, uuid.UUID))
-    node.set("type", action_type)
-    return node
+    return ElementTree.Element(
+        "action",
+        {"id": safe_format(action_id, uuid.UUID), "type": action_type}
+    )
 
 
 def read_action_id(node: ElementTree.Element) -> uuid.UUID:
@@ -533,7 +558,7 @@ def read_property(
     if isinstance(property_type, PropertyType):
         property_type = [property_type]
     return _process_property(
-        action_node.find(f"./property/name[.='{name}']/.."),
+        _find_property_node(action_node, name),
         name,
         property_type
     )
@@ -555,12 +580,69 @@ def read_properties(
         List of values corresponding to the property element of the given name
     """
     # Retrieve the individual elements
-    p_nodes = action_node.findall(f"./property/name[.='{name}']/..")
+    p_nodes = [
+        node for node in action_node.iterfind("property")
+        if node.findtext("name") == name
+    ]
     if isinstance(property_type, PropertyType):
         property_type = [property_type]
     return [_process_property(node, name, property_type) for node in p_nodes]
 
 
+def read_property_dict(
+        action_node: ElementTree.Element,
+        properties: Dict[str, PropertyType | List[PropertyType]]
+) -> Dict[str, Any]:
+    """Returns the values of several properties in a single pass.
+
+    This is equivalent to calling read_property for each entry but only
+    traverses the property elements of the node once.
+
+    Args:
+        action_node: element from which to extract the property values
+        properties: mapping of property names to the valid PropertyType or
+            list of valid types of the corresponding value
+
+    Returns:
+        Dictionary mapping each property name to its value
+    """
+    values = {}
+    for p_node in action_node.iterfind("property"):
+        name = p_node.findtext("name")
+        if name in properties and name not in values:
+            property_type = properties[name]
+            if isinstance(property_type, PropertyType):
+                property_type = [property_type]
+            values[name] = _process_property(p_node, name, property_type)
+
+    for name in properties:
+        if name not in values:
+            raise error.ProfileError(f"A property named '{name}' is missing.")
+    return values
+
+
+def _find_property_node(
+        action_node: ElementTree.Element,
+        name: str
+) -> Optional[ElementTree.Element]:
+    """Returns the first property element with the given name.
+
+    Only the direct property children of the node are inspected, stopping at
+    the first match.
+
+    Args:
+        action_node: element whose property elements are searched
+        name: name of the property element to return
+
+    Returns:
+        Property element with the given name, None if no such element exists
+    """
+    for p_node in action_node.iterfind("property"):
+        if p_node.findtext("name") == name:
+            return p_node
+    return None
+
+
 def _process_property(
         property_node: ElementTree.Element,
         name: str,
@@ -630,9 +712,7 @@ def create_action_ids(name: str, action_ids: List[uuid.UUID]) -> ElementTree.Ele
     """
     node = ElementTree.Element(name)
     for uuid in action_ids:
-        entry = ElementTree.Element("action-id")
-        entry.text = str(uuid)
-        node.append(entry)
+        ElementTree.SubElement(node, "action-id").text = str(uuid)
     return node
 
 
@@ -83,8 +83,8 @@ def test_from_xml_complex():
     assert in3.identifier == 1
     assert in3.device_guid == uuid.UUID("4DCB3090-97EC-11EB-8003-444553540000")
     in4 = a.conditions[3]._inputs[0]
-    in4.scan_code = 42
-    in4.is_extended = True
+    assert in4.event_type == InputType.Keyboard
+    assert in4.identifier == (42, True)
 
     # Condition data
     assert len(a.conditions[0]._inputs) == 2
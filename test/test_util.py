@@ -145,4 +145,39 @@ def test_read_property():
     with pytest.raises(gremlin.error.ProfileError, match=r"Property element is missing"):
         gremlin.util.read_property(
             doc, "value", gremlin.types.PropertyType.Int
-        )
\ No newline at end of file
+        )
+
+def test_read_property_dict():
+    doc = ElementTree.fromstring(xml_doc)
+
+    values = gremlin.util.read_property_dict(
+        doc,
+        {
+            "description": gremlin.types.PropertyType.String,
+            "pi": gremlin.types.PropertyType.Float,
+            "lies": gremlin.types.PropertyType.Bool
+        }
+    )
+    assert values == {"description": "This is a test", "pi": 3.14, "lies": True}
+
+    with pytest.raises(gremlin.error.ProfileError, match=r"A property named"):
+        gremlin.util.read_property_dict(
+            doc, {"does not exist": gremlin.types.PropertyType.Bool}
+        )
+    with pytest.raises(gremlin.error.ProfileError, match=r"Property type mismatch"):
+        gremlin.util.read_property_dict(
+            doc, {"lies": gremlin.types.PropertyType.Float}
+        )
+
+
+def test_parse_bool():
+    assert gremlin.util.parse_bool("true") == True
+    assert gremlin.util.parse_bool("False") == False
+    assert gremlin.util.parse_bool("1") == True
+    assert gremlin.util.parse_bool("00") == False
+    assert gremlin.util.parse_bool(None, True) == True
+
+    with pytest.raises(gremlin.error.ProfileError, match=r"Invalid bool value"):
+        gremlin.util.parse_bool("2")
+    with pytest.raises(gremlin.error.ProfileError, match=r"Invalid bool type"):
+        gremlin.util.parse_bool("yes")